@@ -1,6 +1,9 @@
 import base64
-from urllib.parse import urlencode
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import secrets
+import selectors
+import socket
+from urllib.parse import parse_qs, urlencode, urlsplit
+
 import requests
 
 CLIENT_ID = input("Enter your SPOTIFY_CLIENT_ID: ").strip()
@@ -9,65 +12,99 @@ CLIENT_SECRET = input("Enter your SPOTIFY_CLIENT_SECRET: ").strip()
 REDIRECT_URI = "http://127.0.0.1:8888/callback"
 SCOPES = "playlist-read-private playlist-read-collaborative"
 
+# Precompute the Basic auth header once; credentials don't change.
+BASIC_AUTH = "Basic " + base64.b64encode(f"{CLIENT_ID}:{CLIENT_SECRET}".encode()).decode()
+
+# Random state ties the callback to this run (CSRF protection).
+STATE = secrets.token_urlsafe(16)
+
 # Step 1: Generate Authorization URL
 auth_url = "https://accounts.spotify.com/authorize?" + urlencode({
     "client_id": CLIENT_ID,
     "response_type": "code",
     "redirect_uri": REDIRECT_URI,
-    "scope": SCOPES
+    "scope": SCOPES,
+    "state": STATE
 })
 
 print("\n👉 OPEN THIS URL IN YOUR BROWSER:")
 print(auth_url)
 print("\nThen click 'Agree' when Spotify asks for permissions.\n")
 
-class Handler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        if "code=" not in self.path:
-            self.send_response(400)
-            self.end_headers()
-            self.wfile.write(b"Missing code in callback.")
-            return
-
-        code = self.path.split("code=")[-1]
-
-        self.send_response(200)
-        self.end_headers()
-        self.wfile.write(b"You can close this window now. Token is being generated...")
-
-        print("\nAuthorization code received!")
-        print("Exchanging code for refresh token...\n")
-
-        # Step 2: Exchange code for refresh token
-        token_url = "https://accounts.spotify.com/api/token"
-        auth_header = base64.b64encode(f"{CLIENT_ID}:{CLIENT_SECRET}".encode()).decode()
-
-        headers = {
-            "Authorization": f"Basic {auth_header}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-
-        data = {
-            "grant_type": "authorization_code",
-            "code": code,
-            "redirect_uri": REDIRECT_URI
-        }
-
-        r = requests.post(token_url, headers=headers, data=data)
-        print("Response:\n", r.json())
-
-        refresh_token = r.json().get("refresh_token")
-        if refresh_token:
-            print("\n🎉 Your SPOTIFY_REFRESH_TOKEN:\n")
-            print(refresh_token)
-            print("\nSave this in your .env file!")
-        else:
-            print("\n❌ Failed to get refresh token. Check your Redirect URI and Scopes.")
 
-        import os
-        os._exit(0)  # Stop server immediately
+def parse_code(request_bytes: bytes) -> str:
+    """Pull the authorization code out of the raw GET request line."""
+    request_line = request_bytes.split(b"\r\n", 1)[0].decode(errors="replace")
+    # e.g. "GET /callback?code=AQB...&state=... HTTP/1.1"
+    parts = request_line.split(" ")
+    if len(parts) < 2:
+        return ""
+    qs = parse_qs(urlsplit(parts[1]).query)
+    if qs.get("state", [None])[0] != STATE:
+        return ""  # callback not from the URL we printed
+    return qs.get("code", [""])[0]
+
+
+def wait_for_callback() -> str:
+    """
+    Accept exactly one browser connection on the redirect URI and return the
+    authorization code. A single selectors-driven accept is all we need here —
+    no HTTPServer handler stack, and the listening socket is closed before any
+    blocking network work happens.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(("127.0.0.1", 8888))
+        server.listen(1)
+
+        sel = selectors.DefaultSelector()
+        sel.register(server, selectors.EVENT_READ)
+        sel.select()  # block until the browser hits the redirect URI
+        sel.close()
+
+        conn, _ = server.accept()
+        with conn:
+            data = conn.recv(4096)
+            code = parse_code(data)
+            if code:
+                conn.sendall(b"HTTP/1.0 200 OK\r\nContent-Type: text/plain\r\n\r\n"
+                             b"You can close this window now. Token is being generated...")
+            else:
+                conn.sendall(b"HTTP/1.0 400 Bad Request\r\nContent-Type: text/plain\r\n\r\n"
+                             b"Missing code in callback.")
+    return code
 
 
 print("Starting local server on http://127.0.0.1:8888/callback...")
-server = HTTPServer(("127.0.0.1", 8888), Handler)
-server.serve_forever()
+code = wait_for_callback()
+if not code:
+    print("\n❌ Callback did not contain an authorization code. Try again.")
+    raise SystemExit(1)
+
+print("\nAuthorization code received!")
+print("Exchanging code for refresh token...\n")
+
+# Step 2: Exchange code for refresh token (after the server socket is closed)
+token_url = "https://accounts.spotify.com/api/token"
+
+headers = {
+    "Authorization": BASIC_AUTH,
+    "Content-Type": "application/x-www-form-urlencoded"
+}
+
+data = {
+    "grant_type": "authorization_code",
+    "code": code,
+    "redirect_uri": REDIRECT_URI
+}
+
+r = requests.post(token_url, headers=headers, data=data)
+print("Response:\n", r.json())
+
+refresh_token = r.json().get("refresh_token")
+if refresh_token:
+    print("\n🎉 Your SPOTIFY_REFRESH_TOKEN:\n")
+    print(refresh_token)
+    print("\nSave this in your .env file!")
+else:
+    print("\n❌ Failed to get refresh token. Check your Redirect URI and Scopes.")
@@ -5,31 +5,53 @@ Usage:
     python main.py happy
     OR
     python main.py --mood "relaxed and sleepy"
+    OR (several moods at once, fetched concurrently)
+    python main.py happy, sad, focus
 This script reads env vars for GEMINI_API_KEY and Spotify credentials, then calls the agent.
 """
 
-from dotenv import load_dotenv
-load_dotenv()
-
-import os
 import sys
-from my_agent.agent import handle_mood_with_agent
 
 def print_usage():
-    print("Usage: python main.py <mood>")
+    print("Usage: python main.py <mood>[, <mood>...]")
     print("Example: python main.py happy")
+    print("Example: python main.py happy, sad, focus")
 
 def main():
     if len(sys.argv) < 2:
         print_usage()
         sys.exit(1)
 
-    mood = " ".join(sys.argv[1:]).strip()
-    print(f"Getting recommendations for mood: '{mood}'\n")
+    # Only load env + the agent stack once we know we actually have a mood;
+    # the usage path above stays import-free and fast.
+    from dotenv import load_dotenv
+    load_dotenv()
+    from my_agent.agent import handle_mood_with_agent, format_result
+
+    # Comma-separated args are treated as a batch of moods.
+    moods = [m.strip() for m in " ".join(sys.argv[1:]).split(",") if m.strip()]
+    if not moods:
+        print_usage()
+        sys.exit(1)
+
+    if len(moods) == 1:
+        mood = moods[0]
+        print(f"Getting recommendations for mood: '{mood}'\n")
+        print(handle_mood_with_agent(mood))
+        return
 
-    # Run agent/tool
-    result_text = handle_mood_with_agent(mood)
-    print(result_text)
+    # Several moods: resolve them concurrently over one connection pool and
+    # a shared (warm) access token, then print the results in arg order.
+    from my_agent.spotify_tool import get_tool
+    print(f"Getting recommendations for moods: {', '.join(moods)}\n")
+    results = get_tool().search_by_moods(moods)
+    for mood, res in zip(moods, results):
+        print(f"=== {mood} ===")
+        if isinstance(res, Exception):
+            print(f"Failed to get recommendations: {res}")
+        else:
+            print(format_result(res))
+        print()
 
 if __name__ == "__main__":
     main()
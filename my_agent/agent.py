@@ -7,27 +7,16 @@ Defines an ADK Agent that uses Gemini (via ADK python) and integrates the Spotif
 - If ADK Agent tool integration is available, we register the tool. If not, we provide a helper to call the tool directly.
 """
 
+import importlib
 import os
-from typing import Any
+from typing import Any, Optional
 
-# Import the ADK Agent class you already used in your project
-# Keep the import path you showed in your snippet.
-try:
-    from google.adk.agents.llm_agent import Agent
-except Exception as e:
-    Agent = None  # We'll still provide local fallback behavior if ADK isn't loaded
-
-from .spotify_tool import SpotifySearchTool, SpotifySearchError
-
-# Create the tool instance (reads env by default)
-spotify_tool = SpotifySearchTool()
+from .spotify_tool import SpotifySearchError, get_tool
 
 # Root agent definition. We pick a Gemini flash model as requested (1.5/Flash).
 # The exact model name can be modified per your ADK/Gemini availability.
 MODEL_NAME = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
 
-root_agent = None
-
 # Build a clear instruction that forces the agent to use the tool for retrieving playlists.
 AGENT_INSTRUCTION = """
 You are a music recommendation assistant. When the user provides a mood (for example: happy, sad, romantic, energetic, calm, angry, focus),
@@ -37,24 +26,49 @@ to the user with the top 5 recommended songs, artists, and a short reason why th
 If the tool raises an error, handle it gracefully and inform the user with helpful debugging suggestions (check tokens, retry later).
 """
 
-# Try to instantiate an ADK Agent (if google.adk is present)
-if Agent is not None:
+
+# The tool singleton lives in spotify_tool.get_tool(); re-exported here for
+# callers that used to import it from this module.
+get_spotify_tool = get_tool
+
+# Sentinel so we only attempt ADK import/construction once, not per call.
+_root_agent: Optional[Any] = None
+_root_agent_loaded = False
+
+
+def _get_root_agent() -> Optional[Any]:
+    """
+    Lazily import google.adk and build the Agent on first use. Importing ADK
+    pulls in a large transitive tree, so keep it off the module import path —
+    a plain `python main.py happy` without ADK installed never pays for it.
+    Returns None if ADK is unavailable or construction fails.
+    """
+    global _root_agent, _root_agent_loaded
+    if _root_agent_loaded:
+        return _root_agent
+    _root_agent_loaded = True
+
+    try:
+        Agent = importlib.import_module("google.adk.agents.llm_agent").Agent
+    except Exception:
+        return None  # ADK not installed — fallback to direct tool usage
+
     try:
         # Many ADK agent constructors accept parameters like model, name, description, instruction and tools.
         # We attempt to follow that pattern. If your ADK requires different params, update accordingly.
-        root_agent = Agent(
+        _root_agent = Agent(
             model=MODEL_NAME,
             name="spotify_mood_agent",
             description="ADK agent for recommending Spotify playlists/tracks based on user mood.",
             instruction=AGENT_INSTRUCTION,
             # If your ADK accepts a tools argument, pass it. If not, this will be ignored by ADK or raise,
             # in which case we still provide the spotify_tool for manual calls.
-            tools=[spotify_tool] if hasattr(Agent, "__call__") or True else None
+            tools=[get_spotify_tool()],
         )
-    except Exception as e:
-        # If ADK-agent creation fails, set to None and fallback to direct usage
-        root_agent = None
-        # Do not raise — we'll fallback to calling spotify_tool directly in main.py.
+    except Exception:
+        # If ADK-agent creation fails, leave None and fallback to direct usage.
+        _root_agent = None
+    return _root_agent
 
 def handle_mood_with_agent(mood: str) -> str:
     """
@@ -64,6 +78,8 @@ def handle_mood_with_agent(mood: str) -> str:
     Returns a formatted user-facing string.
     """
     # 1) If ADK agent exists and supports a run/execute API that accepts tools invocation, try that.
+    root_agent = _get_root_agent()
+    spotify_tool = get_spotify_tool()
     if root_agent:
         try:
             # Many ADK Agent APIs provide a `run()` or `respond()` method that accepts user text.
@@ -104,16 +120,15 @@ def format_result(result: dict) -> str:
     """
     playlist = result.get("playlist", {})
     tracks = result.get("tracks", [])
-    lines = []
-    lines.append(f"Recommended playlist: {playlist.get('name')} (by {playlist.get('owner')})")
-    if playlist.get("external_url"):
-        lines.append(f"Playlist link: {playlist.get('external_url')}")
-    if playlist.get("description"):
-        lines.append(f"Description: {playlist.get('description')}")
-    lines.append("\nTop recommendations:")
-    if not tracks:
-        lines.append("No tracks found in the playlist.")
-    for i, t in enumerate(tracks, start=1):
-        preview = t.get("preview_url") or t.get("track_url") or "No preview"
-        lines.append(f"{i}. {t.get('name')} — {t.get('artists')}  |  Preview/Link: {preview}")
-    return "\n".join(lines)
+    tracks_block = "\n".join(
+        f"{i}. {t.get('name')} — {t.get('artists')}  |  "
+        f"Preview/Link: {t.get('preview_url') or t.get('track_url') or 'No preview'}"
+        for i, t in enumerate(tracks, start=1)
+    ) or "No tracks found in the playlist."
+    return "\n".join(filter(None, [
+        f"Recommended playlist: {playlist.get('name')} (by {playlist.get('owner')})",
+        f"Playlist link: {playlist.get('external_url')}" if playlist.get("external_url") else None,
+        f"Description: {playlist.get('description')}" if playlist.get("description") else None,
+        "\nTop recommendations:",
+        tracks_block,
+    ]))
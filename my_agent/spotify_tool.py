@@ -11,18 +11,74 @@ Provides SpotifySearchTool, an ADK-style tool wrapper that:
 This file is written to be importable by an ADK Agent or used directly.
 """
 
+import asyncio
 import base64
+import functools
+import hashlib
+import itertools
+import json
 import os
+import re
+import tempfile
 import time
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# aiohttp only backs the async API; the sync path must keep working without
+# it, so treat it as optional the same way orjson is below.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Fast JSON decoding: orjson parses the raw response bytes directly (skipping
+# the utf-8 text decode inside requests); fall back to stdlib json if absent.
+try:
+    import orjson
+
+    def _json_loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+except ImportError:
+    def _json_loads(raw: bytes) -> Any:
+        return json.loads(raw)
 
 # Constants for Spotify
 SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
 SPOTIFY_SEARCH_URL = "https://api.spotify.com/v1/search"
 SPOTIFY_PLAYLIST_TRACKS_URL = "https://api.spotify.com/v1/playlists/{playlist_id}/tracks"
 
+# Fields masks: ask Spotify for only what choose_best_playlist/format_result
+# actually read, shrinking the payloads (and their parse time) several-fold.
+SEARCH_FIELDS = ("playlists(items(id,name,description,followers.total,"
+                 "owner.display_name,external_urls.spotify))")
+TRACK_FIELDS = "items(track(name,preview_url,external_urls.spotify,artists(name)))"
+
+# Mood-result cache: repeat moods within this window skip Spotify entirely.
+MOOD_CACHE_TTL_SECONDS = 600
+MOOD_CACHE_MAX_ENTRIES = 128
+
+# ETag cache: conditional GETs turn unchanged responses into empty 304s.
+ETAG_CACHE_MAX_ENTRIES = 64
+
+
+@functools.lru_cache(maxsize=64)
+def _mood_pattern(mood: str) -> "re.Pattern":
+    """Case-insensitive literal matcher for a mood; cached for repeat moods."""
+    return re.compile(re.escape(mood), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1)
+def get_tool() -> "SpotifySearchTool":
+    """
+    Process-wide SpotifySearchTool singleton. Production code paths share one
+    instance (and thus one connection pool, token cache and mood cache); tests
+    can still construct SpotifySearchTool directly with injected credentials.
+    """
+    return SpotifySearchTool()
+
 
 class SpotifyAuthError(Exception):
     pass
@@ -38,18 +94,121 @@ class SpotifySearchTool:
     The Agent can call spotify_tool.search_by_mood(mood).
     """
 
+    # Fixed attribute set: slot access is cheaper than __dict__ lookups on
+    # the token-refresh hot path, and catches typo'd attributes early.
+    __slots__ = (
+        "client_id", "client_secret", "refresh_token",
+        "_access_token", "_token_expires_at", "token_cache_seconds",
+        "_basic_auth", "_refresh_data", "_mood_cache", "max_retries",
+        "_token_cache_path", "_etag_cache",
+        "_session", "_a_session", "_a_semaphore", "_a_loop",
+    )
+
     def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
-                 refresh_token: Optional[str] = None, token_cache_seconds: int = 300):
+                 refresh_token: Optional[str] = None, token_cache_seconds: int = 3500,
+                 max_retries: int = 3):
         """
         Initialize tool with credentials (can be None; we'll read from env if so).
         token_cache_seconds: caches access token for this many seconds (reduce requests).
+        max_retries: attempts per API call before giving up on 429/5xx/401 (>= 1).
         """
+        if max_retries < 1:
+            raise ValueError("max_retries must be at least 1.")
         self.client_id = client_id or os.getenv("SPOTIFY_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("SPOTIFY_CLIENT_SECRET")
         self.refresh_token = refresh_token or os.getenv("SPOTIFY_REFRESH_TOKEN")
         self._access_token = None
         self._token_expires_at = 0
         self.token_cache_seconds = token_cache_seconds
+        self.max_retries = max_retries
+
+        # Precompute the Basic auth header and refresh payload once; the
+        # credentials never change for the lifetime of the tool.
+        if self.client_id and self.client_secret:
+            self._basic_auth = "Basic " + base64.b64encode(
+                f"{self.client_id}:{self.client_secret}".encode()).decode()
+        else:
+            self._basic_auth = None
+        self._refresh_data = {"grant_type": "refresh_token", "refresh_token": self.refresh_token}
+
+        # mood -> (fetched_at, result); OrderedDict gives us LRU eviction
+        self._mood_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+        # url+params -> (etag, decoded body) for If-None-Match revalidation
+        self._etag_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+        # Persist the access token across CLI invocations so warm runs skip
+        # the refresh round-trip. Filename keyed on a hash of client_id.
+        if self.client_id:
+            suffix = hashlib.sha256(self.client_id.encode()).hexdigest()[:16]
+            self._token_cache_path = os.path.join(tempfile.gettempdir(), f"spomood_{suffix}.json")
+            self._load_cached_token()
+        else:
+            self._token_cache_path = None
+
+        # One pooled session for all calls: keeps TCP+TLS connections alive to
+        # both Spotify hosts instead of handshaking on every request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://accounts.spotify.com", adapter)
+        self._session.mount("https://api.spotify.com", adapter)
+        self._session.headers.update({"Accept": "application/json"})
+
+        # aiohttp session and rate-limit semaphore for the async API, created
+        # lazily inside the running event loop by _ensure_async_session (a
+        # semaphore binds to one loop, and each asyncio.run uses a fresh one).
+        self._a_session: Optional["aiohttp.ClientSession"] = None
+        self._a_semaphore: Optional[asyncio.Semaphore] = None
+        self._a_loop = None
+
+    def close(self):
+        """Close the underlying HTTP session (safe to call more than once)."""
+        self._session.close()
+
+    async def aclose(self):
+        """Close the aiohttp session used by the async API."""
+        if self._a_session is not None:
+            await self._a_session.close()
+            self._a_session = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _load_cached_token(self) -> None:
+        """Adopt a still-valid access token persisted by a previous process."""
+        try:
+            with open(self._token_cache_path, "rb") as f:
+                cached = _json_loads(f.read())
+            # The file lives in the shared temp dir, so treat its contents as
+            # untrusted: require the exact shape we wrote before using it.
+            if (isinstance(cached, dict)
+                    and isinstance(cached.get("access_token"), str)
+                    and isinstance(cached.get("expires_at"), (int, float))
+                    and cached["expires_at"] > time.time()):
+                self._access_token = cached["access_token"]
+                self._token_expires_at = cached["expires_at"]
+        except (OSError, ValueError):
+            pass  # missing/corrupt cache: just refresh as usual
+
+    def _store_cached_token(self) -> None:
+        """Atomically persist the access token (0600 — it's a bearer token)."""
+        if not self._token_cache_path:
+            return
+        payload = json.dumps({
+            "access_token": self._access_token,
+            "expires_at": self._token_expires_at,
+        }).encode()
+        tmp_path = self._token_cache_path + ".tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._token_cache_path)
+        except OSError:
+            pass  # persistence is best-effort; in-memory cache still works
 
     def _refresh_access_token(self) -> str:
         """
@@ -65,14 +224,12 @@ class SpotifySearchTool:
         if self._access_token and now < self._token_expires_at:
             return self._access_token
 
-        auth_header = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode()).decode()
         headers = {
-            "Authorization": f"Basic {auth_header}",
+            "Authorization": self._basic_auth,
             "Content-Type": "application/x-www-form-urlencoded",
         }
-        data = {"grant_type": "refresh_token", "refresh_token": self.refresh_token}
 
-        r = requests.post(SPOTIFY_TOKEN_URL, headers=headers, data=data, timeout=10)
+        r = self._session.post(SPOTIFY_TOKEN_URL, headers=headers, data=self._refresh_data, timeout=10)
         # Add debug logging
         #print("\n===== DEBUG: SPOTIFY TOKEN RESPONSE =====")
         #print("STATUS:", r.status_code)
@@ -80,39 +237,191 @@ class SpotifySearchTool:
         if r.status_code != 200:
             raise SpotifyAuthError(f"Failed to refresh token: {r.status_code} {r.text}")
 
-        token_response = r.json()
+        token_response = _json_loads(r.content)
         access_token = token_response.get("access_token")
         expires_in = token_response.get("expires_in", 3600)
 
         if not access_token:
             raise SpotifyAuthError(f"Refresh response missing access_token: {token_response}")
 
-        # cache token
+        # cache token until shortly before Spotify expires it (60s safety
+        # buffer), capped by token_cache_seconds
         self._access_token = access_token
-        self._token_expires_at = now + min(expires_in, self.token_cache_seconds)
+        ttl = min(expires_in, self.token_cache_seconds)
+        self._token_expires_at = now + max(ttl - 60, 60)
+        self._store_cached_token()
         return access_token
 
     def _call_spotify(self, url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Helper that ensures a valid access token and calls Spotify API.
+        Transient failures (429 honoring Retry-After, 5xx with exponential
+        backoff, 401 with a token refresh) are retried up to max_retries
+        before surfacing as SpotifySearchError. Known responses are
+        revalidated with If-None-Match so an unchanged resource costs a
+        bodyless 304 instead of a full payload.
         """
-        token = self._refresh_access_token()
-        headers = {"Authorization": f"Bearer {token}"}
-        r = requests.get(url, headers=headers, params=params, timeout=10)
-        #print("\n===== DEBUG: SPOTIFY GET RESPONSE =====")
-        #print("URL:", r.url)
-        #print("STATUS:", r.status_code)
-        #print("BODY:", r.text[:500], "...")   # avoid huge output
-        #print("========================================\n")
-
-        # Basic rate-limit and error handling
-        if r.status_code == 429:
-            # Rate limited
-            retry_after = int(r.headers.get("Retry-After", "1"))
-            raise SpotifySearchError(f"Rate limited by Spotify. Retry after {retry_after} seconds.")
-        if r.status_code >= 400:
-            raise SpotifySearchError(f"Spotify API error: {r.status_code} - {r.text}")
-        return r.json()
+        cache_key = url + (str(sorted(params.items())) if params else "")
+        cached = self._etag_cache.get(cache_key)
+
+        last_error = None
+        for attempt in range(self.max_retries):
+            token = self._refresh_access_token()
+            headers = {"Authorization": f"Bearer {token}"}
+            if cached:
+                headers["If-None-Match"] = cached[0]
+            r = self._session.get(url, headers=headers, params=params, timeout=10)
+            #print("\n===== DEBUG: SPOTIFY GET RESPONSE =====")
+            #print("URL:", r.url)
+            #print("STATUS:", r.status_code)
+            #print("BODY:", r.text[:500], "...")   # avoid huge output
+            #print("========================================\n")
+
+            if r.status_code == 401:
+                # Token may have been revoked server-side before our cached
+                # expiry; drop it and retry with a fresh one.
+                self._access_token = None
+                self._token_expires_at = 0
+                last_error = SpotifySearchError(f"Spotify API error: {r.status_code} - {r.text}")
+                continue
+            if r.status_code == 429:
+                # Rate limited: honor Retry-After (capped) and try again
+                retry_after = int(r.headers.get("Retry-After", "1"))
+                last_error = SpotifySearchError(
+                    f"Rate limited by Spotify. Retry after {retry_after} seconds.")
+                time.sleep(min(retry_after, 5))
+                continue
+            if r.status_code >= 500:
+                last_error = SpotifySearchError(f"Spotify API error: {r.status_code} - {r.text}")
+                time.sleep(0.25 * 2 ** attempt)
+                continue
+            if r.status_code >= 400:
+                # Client errors won't get better on retry
+                raise SpotifySearchError(f"Spotify API error: {r.status_code} - {r.text}")
+            if r.status_code == 304:
+                # Not modified: reuse the decoded body from last time
+                self._etag_cache.move_to_end(cache_key)
+                return cached[1]
+            body = _json_loads(r.content)
+            self._etag_store(cache_key, r.headers.get("ETag"), body)
+            return body
+        raise last_error
+
+    def _etag_store(self, cache_key: str, etag: Optional[str], body: Dict[str, Any]) -> None:
+        if not etag:
+            return
+        self._etag_cache[cache_key] = (etag, body)
+        self._etag_cache.move_to_end(cache_key)
+        while len(self._etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+            self._etag_cache.popitem(last=False)
+
+    async def _ensure_async_session(self) -> "aiohttp.ClientSession":
+        """Create the shared aiohttp session on first use (inside the loop)."""
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for the async API (pip install aiohttp).")
+        loop = asyncio.get_running_loop()
+        if self._a_session is None or self._a_session.closed or self._a_loop is not loop:
+            if self._a_session is not None and not self._a_session.closed:
+                try:
+                    await self._a_session.close()
+                except RuntimeError:
+                    pass  # session's original loop is already gone
+            connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+            self._a_session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Accept": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+            # The semaphore binds to whichever loop it first blocks in, so it
+            # must be recreated together with the session for a new loop.
+            # Stay well under Spotify's rate limit when calls are gathered.
+            self._a_semaphore = asyncio.Semaphore(5)
+            self._a_loop = loop
+        return self._a_session
+
+    async def _a_refresh_access_token(self) -> str:
+        """
+        Async counterpart of _refresh_access_token; shares the same token cache.
+        """
+        if not (self.client_id and self.client_secret and self.refresh_token):
+            raise SpotifyAuthError("Spotify client ID / secret / refresh token not provided.")
+
+        now = time.time()
+        if self._access_token and now < self._token_expires_at:
+            return self._access_token
+
+        headers = {
+            "Authorization": self._basic_auth,
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+        session = await self._ensure_async_session()
+        async with session.post(SPOTIFY_TOKEN_URL, headers=headers, data=self._refresh_data) as r:
+            raw = await r.read()
+            if r.status != 200:
+                raise SpotifyAuthError(f"Failed to refresh token: {r.status} {raw.decode(errors='replace')}")
+            token_response = _json_loads(raw)
+
+        access_token = token_response.get("access_token")
+        expires_in = token_response.get("expires_in", 3600)
+        if not access_token:
+            raise SpotifyAuthError(f"Refresh response missing access_token: {token_response}")
+
+        self._access_token = access_token
+        ttl = min(expires_in, self.token_cache_seconds)
+        self._token_expires_at = now + max(ttl - 60, 60)
+        self._store_cached_token()
+        return access_token
+
+    async def _a_call_spotify(self, url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Async counterpart of _call_spotify; semaphore-guarded so gathered
+        calls do not exceed Spotify's rate limit. Same bounded retry policy
+        as the sync path, with asyncio.sleep for the backoff.
+        """
+        cache_key = url + (str(sorted(params.items())) if params else "")
+        cached = self._etag_cache.get(cache_key)
+
+        # Binds the session and semaphore to the current loop before blocking.
+        await self._ensure_async_session()
+        async with self._a_semaphore:
+            last_error = None
+            for attempt in range(self.max_retries):
+                token = await self._a_refresh_access_token()
+                session = await self._ensure_async_session()
+                headers = {"Authorization": f"Bearer {token}"}
+                if cached:
+                    headers["If-None-Match"] = cached[0]
+                async with session.get(url, headers=headers, params=params) as r:
+                    if r.status == 401:
+                        # Same revoke-and-retry as the sync path.
+                        self._access_token = None
+                        self._token_expires_at = 0
+                        last_error = SpotifySearchError(
+                            f"Spotify API error: {r.status} - {await r.text()}")
+                        delay = 0
+                    elif r.status == 429:
+                        retry_after = int(r.headers.get("Retry-After", "1"))
+                        last_error = SpotifySearchError(
+                            f"Rate limited by Spotify. Retry after {retry_after} seconds.")
+                        delay = min(retry_after, 5)
+                    elif r.status >= 500:
+                        last_error = SpotifySearchError(
+                            f"Spotify API error: {r.status} - {await r.text()}")
+                        delay = 0.25 * 2 ** attempt
+                    elif r.status >= 400:
+                        raise SpotifySearchError(f"Spotify API error: {r.status} - {await r.text()}")
+                    elif r.status == 304:
+                        self._etag_cache.move_to_end(cache_key)
+                        return cached[1]
+                    else:
+                        body = _json_loads(await r.read())
+                        self._etag_store(cache_key, r.headers.get("ETag"), body)
+                        return body
+                if delay:
+                    await asyncio.sleep(delay)
+            raise last_error
 
     def search_playlists(self, mood: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -123,7 +432,8 @@ class SpotifySearchTool:
             raise ValueError("Invalid mood value (empty).")
 
         q = f"{mood} playlist"
-        params = {"q": q, "type": "playlist", "limit": limit}
+        # We only ever pick one playlist, so 5 candidates is plenty.
+        params = {"q": q, "type": "playlist", "limit": min(limit, 5), "fields": SEARCH_FIELDS}
         resp = self._call_spotify(SPOTIFY_SEARCH_URL, params=params)
         #print("\n===== DEBUG: RAW SPOTIFY SEARCH RESPONSE =====")
         #print(resp)
@@ -136,34 +446,52 @@ class SpotifySearchTool:
 
         return playlists
 
+    @staticmethod
+    def _extract_tracks(items: List[Dict[str, Any]], top_n: int) -> List[Dict[str, Any]]:
+        """
+        Stream the simplified track dicts out of a playlist-tracks payload.
+        islice stops iteration as soon as top_n tracks are collected, so no
+        per-item bound check and no oversized intermediate list.
+        """
+        track_iter = (it["track"] for it in items if it.get("track"))
+        return [
+            {
+                "name": t.get("name"),
+                "artists": ", ".join(a.get("name", "") for a in t.get("artists", [])),
+                "preview_url": t.get("preview_url"),
+                "track_url": t.get("external_urls", {}).get("spotify"),
+            }
+            for t in itertools.islice(track_iter, top_n)
+        ]
+
     def get_playlist_top_tracks(self, playlist_id: str, top_n: int = 10) -> List[Dict[str, Any]]:
         """
         Given playlist_id, fetch its tracks and return top_n tracks simplified list:
         Each item: {name, artists (comma string), preview_url, track_url}
         """
         url = SPOTIFY_PLAYLIST_TRACKS_URL.format(playlist_id=playlist_id)
-        params = {"limit": 50}
+        # Server-side truncation: only top_n items, only the fields we render.
+        params = {"limit": top_n, "fields": TRACK_FIELDS}
         resp = self._call_spotify(url, params=params)
-        items = resp.get("items", [])
+        return self._extract_tracks(resp.get("items", []), top_n)
 
-        tracks = []
-        for it in items:
-            track = it.get("track")
-            if not track:
-                continue
-            name = track.get("name")
-            artists = ", ".join([a.get("name", "") for a in track.get("artists", [])])
-            preview_url = track.get("preview_url")
-            external_urls = track.get("external_urls", {}).get("spotify")
-            tracks.append({
-                "name": name,
-                "artists": artists,
-                "preview_url": preview_url,
-                "track_url": external_urls
-            })
-            if len(tracks) >= top_n:
-                break
-        return tracks
+    async def search_playlists_async(self, mood: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Async counterpart of search_playlists."""
+        if not mood or not mood.strip():
+            raise ValueError("Invalid mood value (empty).")
+
+        q = f"{mood} playlist"
+        params = {"q": q, "type": "playlist", "limit": min(limit, 5), "fields": SEARCH_FIELDS}
+        resp = await self._a_call_spotify(SPOTIFY_SEARCH_URL, params=params)
+        playlists = resp.get("playlists", {}).get("items", [])
+        return [p for p in playlists if p is not None]
+
+    async def get_playlist_top_tracks_async(self, playlist_id: str, top_n: int = 10) -> List[Dict[str, Any]]:
+        """Async counterpart of get_playlist_top_tracks."""
+        url = SPOTIFY_PLAYLIST_TRACKS_URL.format(playlist_id=playlist_id)
+        params = {"limit": top_n, "fields": TRACK_FIELDS}
+        resp = await self._a_call_spotify(url, params=params)
+        return self._extract_tracks(resp.get("items", []), top_n)
 
     def choose_best_playlist(self, playlists: List[Dict[str, Any]], mood: str) -> Optional[Dict[str, Any]]:
         """
@@ -174,26 +502,38 @@ class SpotifySearchTool:
         if not playlists:
             return None
 
-        mood_lower = mood.lower()
-        scored = []
-        for p in playlists:
-            score = 0
-            name = p.get("name", "").lower()
-            desc = p.get("description", "").lower()
+        # Regex search scans the original strings case-insensitively, instead
+        # of allocating a lowered copy of every name/description.
+        pat = _mood_pattern(mood)
+
+        def score(p: Dict[str, Any]) -> int:
+            s = 0
             # keyword match
-            if mood_lower in name:
-                score += 50
-            if mood_lower in desc:
-                score += 30
+            if pat.search(p.get("name") or ""):
+                s += 50
+            if pat.search(p.get("description") or ""):
+                s += 30
             # follower_count is nested under 'followers' sometimes not available in search results
-            followers = p.get("followers", {}).get("total", 0)
-            score += min(followers // 1000, 20)  # add up to 20 points
-            scored.append((score, p))
-
-        # sort desc by score
-        scored.sort(key=lambda x: x[0], reverse=True)
-        best = scored[0][1]
-        return best
+            followers = (p.get("followers") or {}).get("total", 0)
+            s += min(followers // 1000, 20)  # add up to 20 points
+            return s
+
+        # single-pass argmax: no scored list, no sort (ties keep first, as before)
+        return max(playlists, key=score)
+
+    def _mood_cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result for this mood if still within the TTL."""
+        hit = self._mood_cache.get(key)
+        if hit and time.time() - hit[0] < MOOD_CACHE_TTL_SECONDS:
+            self._mood_cache.move_to_end(key)
+            return hit[1]
+        return None
+
+    def _mood_cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        self._mood_cache[key] = (time.time(), result)
+        self._mood_cache.move_to_end(key)
+        while len(self._mood_cache) > MOOD_CACHE_MAX_ENTRIES:
+            self._mood_cache.popitem(last=False)
 
     def search_by_mood(self, mood: str, playlists_limit: int = 10, top_n: int = 5) -> Dict[str, Any]:
         """
@@ -205,6 +545,12 @@ class SpotifySearchTool:
         if not mood or not mood.strip():
             raise ValueError("Mood cannot be empty.")
 
+        # 0) repeat mood within the TTL: skip Spotify entirely
+        cache_key = mood.strip().lower()
+        cached = self._mood_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # 1) search playlists
         playlists = self.search_playlists(mood, limit=playlists_limit)
         if not playlists:
@@ -227,4 +573,60 @@ class SpotifySearchTool:
         # 3) fetch top tracks
         tracks = self.get_playlist_top_tracks(playlist_id, top_n=top_n)
 
-        return {"playlist": playlist_info, "tracks": tracks}
+        result = {"playlist": playlist_info, "tracks": tracks}
+        self._mood_cache_put(cache_key, result)
+        return result
+
+    async def search_by_mood_async(self, mood: str, playlists_limit: int = 10, top_n: int = 5) -> Dict[str, Any]:
+        """
+        Async counterpart of search_by_mood. Multiple moods can be gathered
+        concurrently (asyncio.gather) and will share one connection pool;
+        the semaphore in _a_call_spotify keeps the fan-out rate-limit safe.
+        """
+        if not mood or not mood.strip():
+            raise ValueError("Mood cannot be empty.")
+
+        cache_key = mood.strip().lower()
+        cached = self._mood_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        playlists = await self.search_playlists_async(mood, limit=playlists_limit)
+        if not playlists:
+            raise SpotifySearchError(f"No playlists found for mood '{mood}'.")
+
+        best = self.choose_best_playlist(playlists, mood)
+        if not best:
+            best = playlists[0]  # fallback
+
+        playlist_id = best.get("id")
+        playlist_info = {
+            "id": playlist_id,
+            "name": best.get("name"),
+            "description": best.get("description"),
+            "external_url": best.get("external_urls", {}).get("spotify"),
+            "owner": best.get("owner", {}).get("display_name")
+        }
+
+        tracks = await self.get_playlist_top_tracks_async(playlist_id, top_n=top_n)
+
+        result = {"playlist": playlist_info, "tracks": tracks}
+        self._mood_cache_put(cache_key, result)
+        return result
+
+    def search_by_moods(self, moods: List[str], playlists_limit: int = 10, top_n: int = 5) -> List[Dict[str, Any]]:
+        """
+        Sync convenience wrapper: resolve several moods concurrently in one
+        event loop. Each result is the search_by_mood dict (or the raised
+        exception for that mood, mirroring asyncio.gather's return_exceptions).
+        """
+        async def _run():
+            try:
+                return await asyncio.gather(
+                    *[self.search_by_mood_async(m, playlists_limit, top_n) for m in moods],
+                    return_exceptions=True,
+                )
+            finally:
+                await self.aclose()
+
+        return asyncio.run(_run())